@@ -1,217 +1,744 @@
 import requests
+import asyncio
 import base64
+import collections
+import concurrent.futures
+import logging
+import multiprocessing
+import threading
+import queue
 import time
 import sys
 import json
 import random
+import socket
 import os
+import urllib.parse
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Per-process state for the multiprocessing path; set up by _init_worker
+_worker_session = None
+_worker_base_url = None
+
+def _init_worker(base_url):
+    """Give each pool worker its own keep-alive session"""
+    global _worker_session, _worker_base_url
+    _worker_session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=4, max_retries=0)
+    _worker_session.mount('http://', adapter)
+    _worker_session.mount('https://', adapter)
+    _worker_base_url = base_url
+
+def _fuzz_pattern(pattern):
+    """Fuzz one pattern in a pool worker, returning a compact result tuple"""
+    encoded_pattern, url = LoopbackFuzzer._prep(pattern, _worker_base_url)
+    try:
+        response = _worker_session.get(url, timeout=5, allow_redirects=False, stream=True)
+        try:
+            status_code = response.status_code
+            clen = int(response.headers.get('Content-Length') or 0)
+            if LoopbackFuzzer._is_interesting(status_code, clen):
+                clen = len(response.content)
+            elif clen <= LoopbackFuzzer.drain_limit:
+                # Drain so the worker's keep-alive connection is reused
+                response.content
+            return (pattern, encoded_pattern, url, status_code, clen, None)
+        finally:
+            response.close()
+    except requests.exceptions.RequestException as e:
+        return (pattern, encoded_pattern, url, None, 0, str(e))
+
+class _AsyncRateLimiter:
+    """Token bucket enforcing a global requests-per-second cap across workers
+
+    A flat per-worker sleep would multiply the configured delay by the
+    concurrency; refilling tokens at `rate` per second keeps the aggregate
+    request rate capped while leaving workers free to overlap.
+    """
+    def __init__(self, rate):
+        self.rate = rate
+        self._tokens = rate
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.rate, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
 
 class LoopbackFuzzer:
-    def __init__(self, base_url, delay=0.01, log_file="fuzzer_log.json", max_patterns=None):
+    # Position tokens: EMPTY + 0-31
+    _VALUES = ("",) + tuple(str(i) for i in range(32))
+
+    # Streamed bodies up to this size are drained before close so urllib3
+    # returns the connection to the pool; anything bigger is cheaper to
+    # abandon and pay one reconnect for
+    drain_limit = 1 << 20
+
+    def __init__(self, base_url, delay=0.01, log_file="fuzzer_log.json", max_patterns=None, concurrency=128,
+                 per_file_dump=False, log_level=logging.INFO, processes=None):
         self.base_url = base_url
         self.delay = delay
         self.log_file = log_file
         self.max_patterns = max_patterns
-        self.results = []
-        
+        self.concurrency = concurrency
+        self.per_file_dump = per_file_dump
+        self.processes = processes
+        self.flush_every = 1000
+
+        # Aggregate counters instead of a per-request dict list; only
+        # interesting responses (and errors) are kept as full records, so
+        # memory stays bounded no matter how many patterns run
+        self._status_hist = collections.Counter()
+        self._processed = 0
+        self._ok = 0
+        self._errors = 0
+        self._curl_files = 0
+        self._save_errors = 0
+        self._interesting = []
+
+        # Per-request output goes through a queue to a background thread so
+        # the request loop never blocks on stdout syscalls; details are DEBUG,
+        # progress every 1000 requests is INFO
+        # The logger is per-instance (and the handler detached on shutdown)
+        # so repeated runs in one process never stack stale QueueHandlers
+        log_queue = queue.SimpleQueue()
+        self.log = logging.getLogger(f'fuzz.{id(self)}')
+        # Filter at the logger, not just the handler: QueueHandler formats
+        # each record in the submitting thread, so suppressed debug calls
+        # must be dropped before they ever reach the queue
+        self.log.setLevel(log_level)
+        self.log.propagate = False
+        self._queue_handler = QueueHandler(log_queue)
+        self.log.addHandler(self._queue_handler)
+        console = logging.StreamHandler(sys.stderr)
+        console.setLevel(log_level)
+        self._listener = QueueListener(log_queue, console, respect_handler_level=True)
+        self._listener.start()
+
+        # Reuse one keep-alive connection pool instead of paying the TCP
+        # handshake on every request (sync path)
+        self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=64, max_retries=0)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.session.headers.update({'Connection': 'keep-alive'})
+
         # Create curl folder if it doesn't exist
         self.curl_folder = "curl"
-        if not os.path.exists(self.curl_folder):
-            os.makedirs(self.curl_folder)
-            print(f"Created folder: {self.curl_folder}")
-        
-    def generate_random_patterns(self):
-        """Generate random patterns for NUM@NUM@NUM@NUM where NUM can be EMPTY or 0-31"""
-        patterns = []
-        values = [""] + [str(i) for i in range(32)]  # EMPTY + 0-31
-        
-        print("Generating random patterns...")
-        
+        os.makedirs(self.curl_folder, exist_ok=True)
+
+        # One append-mode JSONL dump shared by all responses; a large buffer
+        # turns the open/write/write/close per response into a single
+        # buffered write and avoids creating a million tiny files
+        self._resp_path = os.path.join(self.curl_folder, "responses.jsonl")
+        self._resp_fp = open(self._resp_path, 'ab', buffering=262144)
+        self._resp_count = 0
+        self._resp_lock = threading.Lock()
+
+        # Small dedicated pool so dumps overlap in-flight responses instead
+        # of blocking the event loop (and stay off the default executor)
+        self._disk_pool = concurrent.futures.ThreadPoolExecutor(max_workers=4, thread_name_prefix='disk')
+
+    def total_patterns(self):
+        """Number of patterns a full run will fuzz"""
+        total = 33 ** 4  # 1,185,921 total possible patterns
         if self.max_patterns:
-            total_patterns = self.max_patterns
-        else:
-            total_patterns = 33 ** 4  # 1,185,921 total possible patterns
-        
-        # Generate random patterns
-        for count in range(total_patterns):
-            pos1 = random.choice(values)
-            pos2 = random.choice(values)
-            pos3 = random.choice(values)
-            pos4 = random.choice(values)
-            
+            return min(self.max_patterns, total)
+        return total
+
+    def _iter_patterns(self):
+        """Yield unique random patterns for NUM@NUM@NUM@NUM where NUM can be EMPTY or 0-31
+
+        Samples k distinct integer indices out of the 33^4 pattern space in
+        one C-level random.sample call (pre-shuffled, no duplicates) and
+        decodes each index into its four position tokens with divmod, so no
+        pattern list is ever materialized and no request is wasted on a
+        repeat.
+        """
+        values = self._VALUES
+
+        for idx in random.sample(range(33 ** 4), self.total_patterns()):
+            idx, pos4 = divmod(idx, 33)
+            idx, pos3 = divmod(idx, 33)
+            pos1, pos2 = divmod(idx, 33)
+
             # Build pattern: NUM@NUM@NUM@NUM
-            pattern = f"{pos1}@{pos2}@{pos3}@{pos4}"
-            patterns.append(pattern)
-        
-        # Shuffle the patterns to ensure randomness
-        random.shuffle(patterns)
-        return patterns
-    
-    def save_curl_response(self, pattern, encoded_pattern, response, response_count):
-        """Save individual curl response to file"""
+            yield f"{values[pos1]}@{values[pos2]}@{values[pos3]}@{values[pos4]}"
+
+    @staticmethod
+    def _b64(pattern):
+        """Base64-encode a pattern
+
+        Not memoized: _iter_patterns samples without replacement, so every
+        pattern in a run is unique and a cache would just hold one dead
+        entry per request.
+        """
+        return base64.b64encode(pattern.encode('ascii')).decode('ascii')
+
+    @staticmethod
+    def _prep(pattern, base_url):
+        """(base64, full URL) pair for a pattern against one target"""
+        encoded_pattern = LoopbackFuzzer._b64(pattern)
+        return encoded_pattern, f"{base_url}{encoded_pattern}"
+
+    @staticmethod
+    def _is_interesting(status_code, content_length):
+        """Single definition of which responses are worth keeping/dumping"""
+        return status_code >= 400 or status_code == 200 and content_length == 0
+
+    def _record_response(self, pattern, encoded_pattern, url, status_code, content_length, curl_file):
+        """Fold a response into the aggregate counters, keeping interesting ones"""
+        self._processed += 1
+        self._ok += 1
+        self._status_hist[status_code] += 1
+        if curl_file:
+            self._curl_files += 1
+
+        interesting = self._is_interesting(status_code, content_length)
+        if interesting:
+            self._interesting.append({
+                'pattern': pattern,
+                'encoded_pattern': encoded_pattern,
+                'url': url,
+                'status_code': status_code,
+                'content_length': content_length,
+                'curl_file': curl_file,
+                'timestamp': datetime.now().isoformat()
+            })
+        return interesting
+
+    def _record_error(self, pattern, encoded_pattern, url, error):
+        """Count an errored request and keep its record"""
+        self._processed += 1
+        self._errors += 1
+        self._interesting.append({
+            'pattern': pattern,
+            'encoded_pattern': encoded_pattern,
+            'url': url,
+            'error': str(error),
+            'timestamp': datetime.now().isoformat()
+        })
+
+    def save_curl_response(self, pattern, encoded_pattern, status_code, headers, content, response_count):
+        """Save a curl response (JSONL record, or its own file with per_file_dump)
+
+        Uninteresting responses are skipped outright: the counters already
+        capture their status and length, so dumping headers and body for them
+        is pure overhead.
+        """
+        if not self._is_interesting(status_code, len(content)):
+            return None
+
+        if self.per_file_dump:
+            return self._save_curl_file(pattern, encoded_pattern, status_code, headers, content, response_count)
+
+        try:
+            rec = {
+                'i': response_count,
+                'pattern': pattern,
+                'b64': encoded_pattern,
+                'status': status_code,
+                # Coerce to plain str: aiohttp's header dict uses istr
+                # (str-subclass) keys, which orjson refuses to serialize
+                'headers': {str(k): str(v) for k, v in headers.items()},
+                'body': content.decode('utf-8', errors='replace'),
+                'ts': datetime.now().isoformat()
+            }
+            if orjson:
+                line = orjson.dumps(rec) + b'\n'
+            else:
+                line = json.dumps(rec).encode('utf-8') + b'\n'
+            with self._resp_lock:
+                self._resp_fp.write(line)
+                self._resp_count += 1
+                if self._resp_count % self.flush_every == 0:
+                    self._resp_fp.flush()
+            return self._resp_path
+        except Exception as e:
+            self._save_errors += 1
+            self.log.warning("Error saving curl response: %s", e)
+            return None
+
+    def _save_curl_file(self, pattern, encoded_pattern, status_code, headers, content, response_count):
+        """Save individual curl response to file (debug mode)"""
         try:
             # Create a safe filename
             safe_pattern = pattern.replace('@', '_').replace('/', '_')
             filename = f"response_{response_count:06d}_{safe_pattern}.txt"
             filepath = os.path.join(self.curl_folder, filename)
-            
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(f"URL: {self.base_url}{encoded_pattern}\n")
-                f.write(f"Pattern: {pattern}\n")
-                f.write(f"Base64: {encoded_pattern}\n")
-                f.write(f"Timestamp: {datetime.now().isoformat()}\n")
-                f.write(f"Status Code: {response.status_code}\n")
-                f.write(f"Content Length: {len(response.content)} bytes\n")
-                f.write("-" * 80 + "\n")
-                f.write("HEADERS:\n")
-                for header, value in response.headers.items():
-                    f.write(f"{header}: {value}\n")
-                f.write("-" * 80 + "\n")
-                f.write("CONTENT:\n")
-                f.write(response.text)
-            
+
+            # Binary mode with a wide buffer skips the text codec and keeps
+            # each dump to a couple of large writes; the body goes out as
+            # raw bytes with no decode/re-encode round-trip
+            preamble = (
+                f"URL: {self.base_url}{encoded_pattern}\n"
+                f"Pattern: {pattern}\n"
+                f"Base64: {encoded_pattern}\n"
+                f"Timestamp: {datetime.now().isoformat()}\n"
+                f"Status Code: {status_code}\n"
+                f"Content Length: {len(content)} bytes\n"
+                + "-" * 80 + "\nHEADERS:\n"
+                + '\n'.join(f"{header}: {value}" for header, value in headers.items())
+                + "\n" + "-" * 80 + "\nCONTENT:\n"
+            )
+            with open(filepath, 'wb', buffering=262144) as f:
+                f.write(preamble.encode('utf-8'))
+                f.write(content)
+
             return filepath
         except Exception as e:
-            print(f"Error saving curl response: {e}")
+            self._save_errors += 1
+            self.log.warning("Error saving curl response: %s", e)
             return None
-    
-    def fuzz_server(self):
-        """Fuzz the server with random patterns"""
-        patterns = self.generate_random_patterns()
-        total_patterns = len(patterns)
-        
-        print(f"Starting RANDOM fuzzing with {total_patterns} patterns")
-        print(f"Target: {self.base_url}")
-        print(f"Curl responses saved to: {self.curl_folder}/")
-        print("-" * 80)
-        
-        start_time = datetime.now()
-        
-        for i, pattern in enumerate(patterns, 1):
+
+    async def _fuzz_one(self, session, pattern, i, total_patterns):
+        """Fuzz a single pattern inside the shared session"""
+        # Base64-encode the pattern and build the full URL
+        encoded_pattern, url = self._prep(pattern, self.base_url)
+
+        try:
+            if self._limiter:
+                await self._limiter.acquire()
+            async with session.get(url, timeout=aiohttp.ClientTimeout(total=5), allow_redirects=False) as response:
+                status_code = response.status
+                headers = response.headers
+                content = await response.read()
+
+            # Display response info
+            clen = len(content)
+            self.log.debug("[%d/%d] pattern=%r b64=%r url=%s status=%d length=%d",
+                           i, total_patterns, pattern, encoded_pattern, url, status_code, clen)
+
+            # Save individual curl response off the event loop
+            loop = asyncio.get_running_loop()
+            curl_file = await loop.run_in_executor(
+                self._disk_pool, self.save_curl_response,
+                pattern, encoded_pattern, status_code, headers, content, i
+            )
+
+            # Log interesting responses
+            if self._record_response(pattern, encoded_pattern, url, status_code, clen, curl_file):
+                self.log.warning("[!] INTERESTING: pattern=%r status=%d length=%d",
+                                 pattern, status_code, clen)
+            if self._processed % 1000 == 0:
+                self.log.info("progress: %d/%d patterns", self._processed, total_patterns)
+
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            self._record_error(pattern, encoded_pattern, url, e)
+            self.log.warning("[%d/%d] ERROR pattern=%r url=%s: %s", i, total_patterns, pattern, url, e)
+        except Exception as e:
+            self.log.warning("[%d/%d] UNEXPECTED ERROR pattern=%r: %s", i, total_patterns, pattern, e)
+
+    async def _run(self, patterns, total_patterns):
+        """Drive all patterns through one keep-alive session with bounded concurrency
+
+        Spawns `concurrency` worker tasks that pull from the shared pattern
+        iterator instead of creating one Task per pattern up front, so the
+        task count (and its memory) stays flat no matter how many patterns a
+        run covers.
+        """
+        self._limiter = _AsyncRateLimiter(1.0 / self.delay) if self.delay else None
+        connector = aiohttp.TCPConnector(limit=self.concurrency, limit_per_host=self.concurrency, keepalive_timeout=30)
+        numbered = enumerate(patterns, 1)
+
+        async def worker(session):
+            # Sharing the iterator is safe on one event loop: next() runs
+            # between awaits, never across one
+            for i, pattern in numbered:
+                await self._fuzz_one(session, pattern, i, total_patterns)
+
+        async with aiohttp.ClientSession(connector=connector) as session:
+            await asyncio.gather(*(worker(session) for _ in range(self.concurrency)))
+
+    def _produce_prepared(self, patterns, out_queue):
+        """Feed pre-encoded (pattern, b64, url) tuples to the request thread
+
+        Runs in its own thread so pattern generation and base64/URL prep
+        overlap the network wait of the request in flight; the bounded queue
+        keeps it from running arbitrarily far ahead.
+        """
+        base_url = self.base_url
+        prep = self._prep
+        put = out_queue.put
+        for pattern in patterns:
+            put(prep(pattern, base_url) + (pattern,))
+        put(None)
+
+    def _fuzz_sync(self, patterns, total_patterns):
+        """Fallback sequential loop for when aiohttp is not installed"""
+        # Hoist attribute lookups out of the million-iteration loop
+        do_get = self.session.get
+        save_response = self.save_curl_response
+        record = self._record_response
+        log = self.log
+        delay = self.delay
+        sleep = time.sleep
+
+        prepared = queue.Queue(maxsize=1024)
+        producer = threading.Thread(target=self._produce_prepared, args=(patterns, prepared), daemon=True)
+        producer.start()
+
+        i = 0
+        while True:
+            item = prepared.get()
+            if item is None:
+                break
+            encoded_pattern, url, pattern = item
+            i += 1
             try:
-                # Encode the pattern in base64
-                encoded_pattern = base64.b64encode(pattern.encode()).decode()
-                
-                # Build the full URL
-                url = f"{self.base_url}{encoded_pattern}"
-                
-                # Display real-time information
-                print(f"\n[{i}/{total_patterns}]")
-                print(f"Pattern:    '{pattern}'")
-                print(f"Base64:     '{encoded_pattern}'")
-                print(f"URL:        {url}")
-                
-                # Send request
-                response = requests.get(url, timeout=5, allow_redirects=False)
-                
+                # Send request; stream so uninteresting bodies are never
+                # transferred or utf-8 decoded
+                response = do_get(url, timeout=5, allow_redirects=False, stream=True)
+                try:
+                    status_code = response.status_code
+                    clen = int(response.headers.get('Content-Length') or 0)
+                    content = None
+                    if self._is_interesting(status_code, clen):
+                        # Candidate for saving: pull the body and recheck the
+                        # length in case Content-Length was simply missing
+                        content = response.content
+                        clen = len(content)
+                        if not self._is_interesting(status_code, clen):
+                            content = None
+                    elif clen <= self.drain_limit:
+                        # Drain so the keep-alive connection is reused
+                        # instead of torn down and reopened per request
+                        response.content
+                finally:
+                    response.close()
+
                 # Display response info
-                print(f"Status:     {response.status_code}")
-                print(f"Length:     {len(response.content)} bytes")
-                
-                # Save individual curl response
-                curl_file = self.save_curl_response(pattern, encoded_pattern, response, i)
-                if curl_file:
-                    print(f"Curl saved: {os.path.basename(curl_file)}")
-                
-                print("-" * 40)
-                
-                # Collect results
-                result = {
-                    'pattern': pattern,
-                    'encoded_pattern': encoded_pattern,
-                    'url': url,
-                    'status_code': response.status_code,
-                    'content_length': len(response.content),
-                    'curl_file': curl_file,
-                    'timestamp': datetime.now().isoformat()
-                }
-                
-                self.results.append(result)
-                
+                log.debug("[%d/%d] pattern=%r b64=%r url=%s status=%d length=%d",
+                          i, total_patterns, pattern, encoded_pattern, url, status_code, clen)
+
+                # Save only the interesting subset; the fast path records
+                # status and length without touching the body
+                curl_file = None
+                if content is not None:
+                    curl_file = save_response(pattern, encoded_pattern, status_code, response.headers, content, i)
+
                 # Log interesting responses
-                if response.status_code >= 400 or response.status_code == 200 and len(response.content) == 0:
-                    print(f"    [!] INTERESTING: Status {response.status_code}, Length {len(response.content)}")
-                
-                time.sleep(self.delay)
-                
+                if record(pattern, encoded_pattern, url, status_code, clen, curl_file):
+                    log.warning("[!] INTERESTING: pattern=%r status=%d length=%d", pattern, status_code, clen)
+                if self._processed % 1000 == 0:
+                    log.info("progress: %d/%d patterns", self._processed, total_patterns)
+
+                sleep(delay)
+
             except requests.exceptions.RequestException as e:
-                error_result = {
-                    'pattern': pattern,
-                    'encoded_pattern': encoded_pattern,
-                    'url': url,
-                    'error': str(e),
-                    'timestamp': datetime.now().isoformat()
-                }
-                self.results.append(error_result)
-                print(f"\n[{i}/{total_patterns}] ERROR: {pattern}")
-                print(f"Base64: '{encoded_pattern}'")
-                print(f"URL: {url}")
-                print(f"Error: {e}")
-                print("-" * 40)
-                
+                self._record_error(pattern, encoded_pattern, url, e)
+                self.log.warning("[%d/%d] ERROR pattern=%r url=%s: %s", i, total_patterns, pattern, url, e)
+
             except KeyboardInterrupt:
                 print(f"\nFuzzing interrupted. Processed {i}/{total_patterns} patterns.")
                 break
             except Exception as e:
-                print(f"\n[{i}/{total_patterns}] UNEXPECTED ERROR: {e}")
-                print(f"Pattern: '{pattern}'")
-                print("-" * 40)
-        
-        # Save results
-        self.save_results()
-        
-        # Print summary
-        self.print_summary(start_time)
-    
+                self.log.warning("[%d/%d] UNEXPECTED ERROR pattern=%r: %s", i, total_patterns, pattern, e)
+
+    def _fuzz_pool(self, patterns, total_patterns):
+        """Fan patterns out to a process pool; best for loopback targets
+
+        With microsecond round-trips the bottleneck is the interpreter, not
+        the network, so N worker processes (each with its own session) scale
+        nearly linearly. Workers return compact tuples; bodies stay in the
+        workers, so this mode records stats but no curl dumps.
+        """
+        with multiprocessing.Pool(processes=self.processes, initializer=_init_worker,
+                                  initargs=(self.base_url,)) as pool:
+            results = pool.imap_unordered(_fuzz_pattern, patterns, chunksize=256)
+            for pattern, encoded_pattern, url, status_code, clen, error in results:
+                if error is not None:
+                    self._record_error(pattern, encoded_pattern, url, error)
+                    self.log.warning("ERROR pattern=%r url=%s: %s", pattern, url, error)
+                elif self._record_response(pattern, encoded_pattern, url, status_code, clen, None):
+                    self.log.warning("[!] INTERESTING: pattern=%r status=%d length=%d",
+                                     pattern, status_code, clen)
+                if self._processed % 1000 == 0:
+                    self.log.info("progress: %d/%d patterns", self._processed, total_patterns)
+
+    def _describe_transport(self):
+        """One banner line saying how requests will be sent"""
+        if self.processes:
+            return f"Process pool: {self.processes} workers"
+        if aiohttp:
+            return f"Concurrency: {self.concurrency} requests in flight"
+        return "aiohttp not installed, falling back to sequential requests"
+
+    def _dispatch(self, patterns, total_patterns):
+        """Run the patterns through the best available transport"""
+        if self.processes:
+            self._fuzz_pool(patterns, total_patterns)
+        elif aiohttp:
+            asyncio.run(self._run(patterns, total_patterns))
+        else:
+            self._fuzz_sync(patterns, total_patterns)
+
+    def fuzz_server(self):
+        """Fuzz the server with random patterns"""
+        patterns = self._iter_patterns()
+        total_patterns = self.total_patterns()
+
+        print(f"Starting RANDOM fuzzing with {total_patterns} patterns")
+        print(f"Target: {self.base_url}")
+        print(f"Curl responses saved to: {self.curl_folder}/")
+        print(self._describe_transport())
+        print("-" * 80)
+
+        start_time = datetime.now()
+
+        try:
+            self._dispatch(patterns, total_patterns)
+        except KeyboardInterrupt:
+            print(f"\nFuzzing interrupted. Processed {self._processed}/{total_patterns} patterns.")
+        finally:
+            self.session.close()
+            self._disk_pool.shutdown(wait=True)
+            self._resp_fp.close()
+            self.log.removeHandler(self._queue_handler)
+            self._listener.stop()
+
+            # Save results and print the summary even when a transport
+            # error aborts the run: whatever was collected still counts
+            self.save_results()
+            self.print_summary(start_time)
+
     def save_results(self):
-        """Save results to JSON file"""
+        """Save interesting results to JSON file"""
         try:
-            with open(self.log_file, 'w') as f:
-                json.dump(self.results, f, indent=2)
+            if orjson:
+                data = orjson.dumps(self._interesting, option=orjson.OPT_INDENT_2)
+            else:
+                data = json.dumps(self._interesting, indent=2).encode('utf-8')
+            with open(self.log_file, 'wb') as f:
+                f.write(data)
             print(f"\nResults saved to {self.log_file}")
         except Exception as e:
             print(f"Error saving results: {e}")
-    
+
     def print_summary(self, start_time):
         """Print fuzzing summary"""
         end_time = datetime.now()
         duration = end_time - start_time
-        
-        successful = [r for r in self.results if 'status_code' in r]
-        errors = [r for r in self.results if 'error' in r]
-        
-        status_codes = {}
-        for result in successful:
-            code = result['status_code']
-            status_codes[code] = status_codes.get(code, 0) + 1
-        
-        # Count curl files saved
-        curl_files = [r for r in self.results if 'curl_file' in r and r['curl_file'] is not None]
-        
+
         print("\n" + "=" * 60)
         print("RANDOM FUZZING SUMMARY")
         print("=" * 60)
-        print(f"Total patterns: {len(self.results)}")
-        print(f"Successful requests: {len(successful)}")
-        print(f"Errors: {len(errors)}")
-        print(f"Curl files saved: {len(curl_files)}")
+        print(f"Total patterns: {self._processed}")
+        print(f"Successful requests: {self._ok}")
+        print(f"Errors: {self._errors}")
+        print(f"Interesting responses: {len(self._interesting)}")
+        print(f"Curl files saved: {self._curl_files}")
+        print(f"Failed saves: {self._save_errors}")
         print(f"Duration: {duration}")
         print(f"Status codes distribution:")
-        for code, count in sorted(status_codes.items()):
+        for code, count in sorted(self._status_hist.items()):
             print(f"  {code}: {count}")
         print(f"Curl folder: {self.curl_folder}/")
         print(f"JSON results: {self.log_file}")
         print("=" * 60)
 
+class RawFuzzer(LoopbackFuzzer):
+    """Pipelined raw-socket transport for loopback targets
+
+    Skips requests/urllib3 entirely: one persistent connection, batches of
+    pipelined HTTP/1.1 GETs written back-to-back, and responses parsed off
+    the same socket in order. The fuzzer owns both ends on 127.0.0.1, so
+    head-of-line blocking from pipelining does not matter there; `delay` is
+    ignored since this mode exists to go as fast as the server allows.
+    """
+    batch_size = 64
+
+    def __init__(self, base_url, **kwargs):
+        super().__init__(base_url, **kwargs)
+        parts = urllib.parse.urlsplit(base_url)
+        if parts.scheme != 'http':
+            raise ValueError(f"RawFuzzer speaks plaintext HTTP only, got {parts.scheme!r}; "
+                             "use LoopbackFuzzer for https targets")
+        self._host = parts.hostname
+        self._port = parts.port or 80
+        # The pattern is appended right after base_url, so the request
+        # target is everything after the netloc verbatim: a '?' goes in
+        # only if the base URL has one (e.g. '...index.php?q=' keeps its
+        # 'q=' prefix, while a query-less base stays query-less)
+        target = parts.path or '/'
+        if '?' in base_url:
+            target += f"?{parts.query}"
+        self._req_head = f"GET {target}".encode('ascii')
+        self._req_tail = (f" HTTP/1.1\r\nHost: {parts.netloc}\r\n"
+                          "Connection: keep-alive\r\n\r\n").encode('ascii')
+        self._sock = None
+        self._fp = None
+
+    def _build_req(self, encoded_pattern):
+        """Raw request bytes for one pattern"""
+        return self._req_head + encoded_pattern.encode('ascii') + self._req_tail
+
+    def _connect(self):
+        """(Re)open the persistent connection"""
+        self._close_sock()
+        self._sock = socket.create_connection((self._host, self._port), timeout=5)
+        self._sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._fp = self._sock.makefile('rb')
+
+    def _reconnect(self):
+        """Open the connection, retrying with backoff before giving up
+
+        A refused connect must not take the whole run (and every result
+        collected so far) down with it, so transient failures get three
+        attempts; only then does the error propagate and end the run.
+        """
+        last_error = None
+        for attempt in range(1, 4):
+            try:
+                self._connect()
+                return
+            except OSError as e:
+                last_error = e
+                self.log.warning("connect to %s:%d failed (attempt %d/3): %s",
+                                 self._host, self._port, attempt, e)
+                time.sleep(0.5 * 2 ** (attempt - 1))
+        raise last_error
+
+    def _close_sock(self):
+        if self._fp is not None:
+            self._fp.close()
+            self._fp = None
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+
+    def _read_response(self):
+        """Parse one HTTP/1.1 response off the shared buffered reader
+
+        Returns (status, headers, body, close) where close means the server
+        is done with this connection and the rest of the pipeline is lost.
+        """
+        fp = self._fp
+        status_line = fp.readline()
+        if not status_line:
+            raise ConnectionError("server closed connection")
+        status_code = int(status_line.split(None, 2)[1])
+
+        headers = {}
+        while True:
+            line = fp.readline()
+            if line in (b'\r\n', b'\n', b''):
+                break
+            name, _, value = line.partition(b':')
+            headers[name.strip().decode('latin-1')] = value.strip().decode('latin-1')
+
+        lowered = {k.lower(): v for k, v in headers.items()}
+        if lowered.get('transfer-encoding', '').lower() == 'chunked':
+            body = bytearray()
+            while True:
+                size = int(fp.readline().split(b';')[0], 16)
+                if size == 0:
+                    fp.readline()  # trailing CRLF
+                    break
+                body += fp.read(size)
+                fp.readline()  # chunk CRLF
+            body = bytes(body)
+        elif 'content-length' in lowered:
+            body = fp.read(int(lowered['content-length']))
+        else:
+            body = fp.read()  # close-delimited
+
+        close = (lowered.get('connection', '').lower() == 'close'
+                 or status_line.startswith(b'HTTP/1.0'))
+        return status_code, headers, body, close
+
+    def _fuzz_raw(self, patterns, total_patterns):
+        """Send pipelined batches over the persistent socket"""
+        self._reconnect()
+        try:
+            batch = []
+            for pattern in patterns:
+                encoded_pattern, url = self._prep(pattern, self.base_url)
+                batch.append((pattern, encoded_pattern, url, self._build_req(encoded_pattern)))
+                if len(batch) >= self.batch_size:
+                    self._run_batch(batch, total_patterns)
+                    batch = []
+            if batch:
+                self._run_batch(batch, total_patterns)
+        finally:
+            self._close_sock()
+
+    def _run_batch(self, batch, total_patterns):
+        """Write one pipelined batch and consume its responses in order"""
+        pending = batch
+        while pending:
+            try:
+                self._sock.sendall(b''.join(req for *_unused, req in pending))
+            except OSError:
+                self._reconnect()
+                continue
+
+            consumed = 0
+            reconnect = False
+            for pattern, encoded_pattern, url, _req in pending:
+                try:
+                    status_code, headers, body, close = self._read_response()
+                except (OSError, ValueError, IndexError) as e:
+                    # Stream is unusable; count this one as errored and
+                    # replay the rest of the batch on a fresh connection
+                    self._record_error(pattern, encoded_pattern, url, e)
+                    self.log.warning("ERROR pattern=%r url=%s: %s", pattern, url, e)
+                    consumed += 1
+                    reconnect = True
+                    break
+
+                consumed += 1
+                clen = len(body)
+                self.log.debug("pattern=%r b64=%r url=%s status=%d length=%d",
+                               pattern, encoded_pattern, url, status_code, clen)
+                curl_file = self.save_curl_response(pattern, encoded_pattern, status_code,
+                                                    headers, body, self._processed + 1)
+                if self._record_response(pattern, encoded_pattern, url, status_code, clen, curl_file):
+                    self.log.warning("[!] INTERESTING: pattern=%r status=%d length=%d",
+                                     pattern, status_code, clen)
+                if self._processed % 1000 == 0:
+                    self.log.info("progress: %d/%d patterns", self._processed, total_patterns)
+                if close:
+                    reconnect = True
+                    break
+
+            pending = pending[consumed:]
+            if reconnect and pending:
+                self._reconnect()
+
+    def _describe_transport(self):
+        return f"Raw pipelined socket to {self._host}:{self._port}, batches of {self.batch_size}"
+
+    def _dispatch(self, patterns, total_patterns):
+        self._fuzz_raw(patterns, total_patterns)
+
 def main():
     # Configuration
     BASE_URL = "http://rodong.rep.kp/ko/index.php?"
     DELAY = 0.01  # Adjust based on your needs
     MAX_PATTERNS = None  # Set to a number for testing, None for all
-    
-    fuzzer = LoopbackFuzzer(BASE_URL, DELAY, max_patterns=MAX_PATTERNS)
-    
+    CONCURRENCY = 128  # Simultaneous requests when aiohttp is available
+
+    fuzzer = LoopbackFuzzer(BASE_URL, DELAY, max_patterns=MAX_PATTERNS, concurrency=CONCURRENCY)
+
     print("Loopback Server Fuzzer - Real-time Display with Curl Saving")
     print("=" * 60)
     print(f"Target: {BASE_URL}")
@@ -222,7 +749,7 @@ def main():
     print(f"Delay between requests: {DELAY} seconds")
     print(f"Curl responses will be saved to: curl/")
     print("=" * 60)
-    
+
     try:
         input("Press Enter to start fuzzing...")
         print("\nStarting fuzzing (Ctrl+C to stop)...")